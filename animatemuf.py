@@ -2,7 +2,6 @@
 
 import argparse
 import gc
-import json
 import logging
 import os
 import re
@@ -15,6 +14,11 @@ from datetime import datetime, timedelta
 
 from PIL import Image, ImageFont, ImageDraw
 
+try:
+  from orjson import loads as json_loads
+except ImportError:
+  from json import loads as json_loads
+
 from sunslack import read_config
 
 NOAA = "https://services.swpc.noaa.gov/experimental"
@@ -22,16 +26,15 @@ SOURCE_JSON = NOAA + "/products/animations/ctipe_muf.json"
 
 logging.basicConfig(level=logging.INFO)
 
-RE_TIME = re.compile(r'.*_(\d+T\d+).png').match
+RE_TIME = re.compile(r'.*_(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2}).png').match
 
 def extract_time(name):
-  str_time = RE_TIME(name).group(1)
-  return datetime.strptime(str_time, '%Y%m%dT%H%M%S')
+  return datetime(*(int(v) for v in RE_TIME(name).groups()))
 
 def retreive_files(config):
   urlretrieve(SOURCE_JSON, config.muf_file)
-  with open(config.muf_file, 'r', encoding='utf-8') as fdin:
-    data_source = json.load(fdin)
+  with open(config.muf_file, 'rb') as fdin:
+    data_source = json_loads(fdin.read())
     for url in data_source:
       filename = os.path.basename(url['url'])
       target_name = os.path.join(config.target_dir, filename)